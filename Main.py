@@ -53,8 +53,42 @@ def get_direction_label(dx, dy):
     if h_dir == "" and v_dir == "": return "STATIONARY"
     return f"{h_dir} {v_dir}".strip()
 
-def main():
-    cap = cv2.VideoCapture(0)
+def detect_target(frame):
+    """Finds the largest red blob. Returns ((x, y), radius, center) or None."""
+    blurred = cv2.GaussianBlur(frame, (11, 11), 0)
+    hsv = cv2.cvtColor(blurred, cv2.COLOR_BGR2HSV)
+    mask = cv2.inRange(hsv, LOWER_RED1, UPPER_RED1) + cv2.inRange(hsv, LOWER_RED2, UPPER_RED2)
+    mask = cv2.erode(mask, None, iterations=2)
+    mask = cv2.dilate(mask, None, iterations=2)
+    contours, _ = cv2.findContours(mask.copy(), cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    
+    if len(contours) == 0:
+        return None
+    
+    c = max(contours, key=cv2.contourArea)
+    ((x, y), radius) = cv2.minEnclosingCircle(c)
+    M = cv2.moments(c)
+    
+    if M["m00"] <= 0 or radius <= 10:
+        return None
+    
+    center = (int(M["m10"] / M["m00"]), int(M["m01"] / M["m00"]))
+    return (x, y), radius, center
+
+def assess_threat(x, y, dx, dy, growth_rate, center_x, center_y):
+    """Projects the target forward and checks it against the collision zone."""
+    pred_x = int(x + (dx * PREDICTION_FRAMES))
+    pred_y = int(y + (dy * PREDICTION_FRAMES))
+    dist_future = np.linalg.norm(np.array((pred_x, pred_y)) - np.array((center_x, center_y)))
+    
+    is_intercept = dist_future < COLLISION_ZONE
+    is_approaching = growth_rate > GROWTH_THRESHOLD
+    return is_intercept, is_approaching
+
+def main(cap=None):
+    # Any object with a VideoCapture-style read() works (e.g. simulator.SyntheticCamera)
+    if cap is None:
+        cap = cv2.VideoCapture(0)
     
     # Deques act as the "Black Box Recorder" memory
     pos_pts = deque(maxlen=BUFFER_SIZE)
@@ -71,76 +105,61 @@ def main():
         center_x, center_y = w // 2, h // 2
         
         # --- 1. COMPUTER VISION (The Sensor) ---
-        blurred = cv2.GaussianBlur(frame, (11, 11), 0)
-        hsv = cv2.cvtColor(blurred, cv2.COLOR_BGR2HSV)
-        mask = cv2.inRange(hsv, LOWER_RED1, UPPER_RED1) + cv2.inRange(hsv, LOWER_RED2, UPPER_RED2)
-        mask = cv2.erode(mask, None, iterations=2)
-        mask = cv2.dilate(mask, None, iterations=2)
-        contours, _ = cv2.findContours(mask.copy(), cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        target = detect_target(frame)
         
         # Default HUD State
         status_msg = "SCANNING SECTOR..."
         status_color = (0, 255, 0) # Green
         vector_text = "NO TARGET"
         
-        if len(contours) > 0:
-            c = max(contours, key=cv2.contourArea)
-            ((x, y), radius) = cv2.minEnclosingCircle(c)
-            M = cv2.moments(c)
+        if target is not None:
+            (x, y), radius, center = target
             
-            if M["m00"] > 0 and radius > 10:
-                center = (int(M["m10"] / M["m00"]), int(M["m01"] / M["m00"]))
-                
-                # Update Memory
-                pos_pts.appendleft(center)
-                rad_pts.appendleft(radius)
-                
-                # --- 2. DYNAMICS ANALYSIS (The Brain) ---
-                (dx, dy), growth_rate = calculate_dynamics(pos_pts, rad_pts)
-                direction_label = get_direction_label(dx, dy)
+            # Update Memory
+            pos_pts.appendleft(center)
+            rad_pts.appendleft(radius)
+            
+            # --- 2. DYNAMICS ANALYSIS (The Brain) ---
+            (dx, dy), growth_rate = calculate_dynamics(pos_pts, rad_pts)
+            direction_label = get_direction_label(dx, dy)
+            
+            # Z-Axis Logic
+            z_label = "STABLE"
+            if growth_rate > GROWTH_THRESHOLD: z_label = "APPROACHING"
+            elif growth_rate < -GROWTH_THRESHOLD: z_label = "RECEDING"
+
+            # Prediction Logic
+            is_intercept, is_approaching = assess_threat(x, y, dx, dy, growth_rate, center_x, center_y)
+
+            # --- 3. DECISION MAKING ---
+            if is_intercept and is_approaching:
+                status_color = (0, 0, 255) # Red
+                status_msg = "⚠️ COLLISION COURSE"
                 
-                # Z-Axis Logic
-                z_label = "STABLE"
-                if growth_rate > GROWTH_THRESHOLD: z_label = "APPROACHING"
-                elif growth_rate < -GROWTH_THRESHOLD: z_label = "RECEDING"
-
-                # Prediction Logic
-                pred_x = int(x + (dx * PREDICTION_FRAMES))
-                pred_y = int(y + (dy * PREDICTION_FRAMES))
-                dist_future = np.linalg.norm(np.array((pred_x, pred_y)) - np.array((center_x, center_y)))
+                # Smart Evasion Calculation
+                dodge_x = "RIGHT" if dx < 0 else "LEFT"
+                dodge_y = "DOWN" if dy < 0 else "UP"
                 
-                is_intercept = dist_future < COLLISION_ZONE
-                is_approaching = growth_rate > GROWTH_THRESHOLD
-
-                # --- 3. DECISION MAKING ---
-                if is_intercept and is_approaching:
-                    status_color = (0, 0, 255) # Red
-                    status_msg = "⚠️ COLLISION COURSE"
-                    
-                    # Smart Evasion Calculation
-                    dodge_x = "RIGHT" if dx < 0 else "LEFT"
-                    dodge_y = "DOWN" if dy < 0 else "UP"
-                    
-                    cv2.putText(frame, f"ACTION: THRUST {dodge_x} & {dodge_y}", (50, h - 80), 
-                                cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 255), 2)
-                    
-                    # Draw Collision Warning Line
-                    cv2.line(frame, (int(x), int(y)), (center_x, center_y), (0, 0, 255), 3)
-
-                elif is_intercept and not is_approaching:
-                    status_color = (255, 100, 0) # Blue-ish
-                    status_msg = "TRAJECTORY INTERSECT (SAFE - RECEDING)"
-                else:
-                    status_color = (0, 255, 255) # Yellow
-                    status_msg = "TRACKING TARGET"
-
-                # Update Vector Text
-                vector_text = f"V: {direction_label} | Z: {z_label}"
+                cv2.putText(frame, f"ACTION: THRUST {dodge_x} & {dodge_y}", (50, h - 80), 
+                            cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 255), 2)
                 
-                # Draw Object & Prediction
-                cv2.circle(frame, (int(x), int(y)), int(radius), status_color, 2)
-                if abs(dx) > 1 or abs(dy) > 1:
-                    cv2.arrowedLine(frame, (int(x), int(y)), (int(x+dx*20), int(y+dy*20)), (0, 255, 255), 2)
+                # Draw Collision Warning Line
+                cv2.line(frame, (int(x), int(y)), (center_x, center_y), (0, 0, 255), 3)
+
+            elif is_intercept and not is_approaching:
+                status_color = (255, 100, 0) # Blue-ish
+                status_msg = "TRAJECTORY INTERSECT (SAFE - RECEDING)"
+            else:
+                status_color = (0, 255, 255) # Yellow
+                status_msg = "TRACKING TARGET"
+
+            # Update Vector Text
+            vector_text = f"V: {direction_label} | Z: {z_label}"
+            
+            # Draw Object & Prediction
+            cv2.circle(frame, (int(x), int(y)), int(radius), status_color, 2)
+            if abs(dx) > 1 or abs(dy) > 1:
+                cv2.arrowedLine(frame, (int(x), int(y)), (int(x+dx*20), int(y+dy*20)), (0, 255, 255), 2)
 
         # --- 4. VISUALIZATION (The HUD) ---
         
@@ -59,8 +59,10 @@ def get_direction_label(dx, dy):
     if h_dir == "" and v_dir == "": return "STATIONARY"
     return f"{h_dir} {v_dir}".strip()
 
-def main():
-    cap = cv2.VideoCapture(0, cv2.CAP_DSHOW)
+def main(cap=None):
+    # Any object with a VideoCapture-style read() works (e.g. simulator.SyntheticCamera)
+    if cap is None:
+        cap = cv2.VideoCapture(0, cv2.CAP_DSHOW)
     cap.set(cv2.CAP_PROP_AUTO_EXPOSURE, 0.25) 
     cap.set(cv2.CAP_PROP_EXPOSURE, EXPOSURE_VAL) 
     
@@ -68,8 +68,9 @@ system_state = {
 }
 
 class VideoCamera(object):
-    def __init__(self):
-        self.video = cv2.VideoCapture(0, cv2.CAP_DSHOW)
+    def __init__(self, video=None):
+        # Any object with a VideoCapture-style read() works (e.g. simulator.SyntheticCamera)
+        self.video = video if video is not None else cv2.VideoCapture(0, cv2.CAP_DSHOW)
         self.video.set(cv2.CAP_PROP_AUTO_EXPOSURE, 0.25)
         self.video.set(cv2.CAP_PROP_EXPOSURE, EXPOSURE_VAL)
         
@@ -0,0 +1,226 @@
+import argparse
+import sys
+import time
+from collections import deque
+
+import Main
+import simulator
+
+# --- CONFIGURATION ---
+# An impact is only "warned" if COLLISION COURSE is still up within this long before it.
+# Lead time runs from the start of the latest episode on that object that reaches this
+# window; no gaps are allowed, so an earlier episode that dropped out does not count.
+# Warning episodes raised on objects that never hit the satellite are false alarms.
+WARNING_HORIZON = 3.0   # seconds
+OBJECT_COUNTS = [1, 2, 4, 8, 16]
+
+# YOLO Sensor (same filtering as Main2.py, used with --sprites)
+MODEL_PATH = r"D:\test\Find-PaperBalls-1\runs\detect\train4\weights\best.pt"
+CONFIDENCE_MIN = 0.50
+RATIO_MIN = 0.70
+RATIO_MAX = 1.40
+
+
+def yolo_detector(model_path=MODEL_PATH):
+    """Builds a detect(frame) for run_trial() that uses the trained YOLO model.
+
+    Picks the first box that passes Main2.py's confidence and aspect-ratio
+    filters and returns it in Main.detect_target()'s format.
+    """
+    from ultralytics import YOLO
+    model = YOLO(model_path)
+
+    def detect(frame):
+        for r in model(frame, stream=True, verbose=False, conf=0.40):
+            for box in r.boxes:
+                if float(box.conf[0]) < CONFIDENCE_MIN: continue
+
+                x1, y1, x2, y2 = map(int, box.xyxy[0])
+                obj_w = x2 - x1
+                obj_h = y2 - y1
+                aspect_ratio = obj_w / float(obj_h)
+                if aspect_ratio < RATIO_MIN or aspect_ratio > RATIO_MAX:
+                    continue
+
+                center = (x1 + (obj_w // 2), y1 + (obj_h // 2))
+                return center, max(obj_w, obj_h) // 2, center
+        return None
+
+    return detect
+
+
+def true_pixel_velocity(obj, t, cam):
+    """Ground-truth on-screen motion (pixels/frame) of an object at time t."""
+    now = simulator.project(obj.position(t), obj.radius, cam.width, cam.height)
+    prev = simulator.project(obj.position(t - 1.0 / cam.fps), obj.radius, cam.width, cam.height)
+    if now is None or prev is None:
+        return None
+    return now[0][0] - prev[0][0], now[0][1] - prev[0][1]
+
+
+def run_trial(scenario, count, width=simulator.FRAME_WIDTH, height=simulator.FRAME_HEIGHT,
+              fps=simulator.FRAME_RATE, duration=6.0, seed=0, sprites=None, detect=Main.detect_target):
+    """Plays one scene through the Main.py tracker and scores it against ground truth.
+
+    `detect` is the sensor; pass yolo_detector() when the scene uses dataset sprites.
+    """
+    scene = simulator.build_scene(scenario, count, seed, sprites)
+    cam = simulator.SyntheticCamera(scene, width, height, fps, duration, seed=seed)
+    center_x, center_y = width // 2, height // 2
+
+    pos_pts = deque(maxlen=Main.BUFFER_SIZE)
+    rad_pts = deque(maxlen=Main.BUFFER_SIZE)
+
+    warnings = []
+    tracked = []   # Ground-truth object the tracker was locked onto, per frame
+    direction_hits, direction_total = 0, 0
+    render_time, track_time = 0.0, 0.0
+
+    while True:
+        t0 = time.perf_counter()
+        ret, frame = cam.read()
+        t1 = time.perf_counter()
+        if not ret: break
+        t = (cam.frame_index - 1) / float(fps)
+
+        # Same per-frame steps as Main.main(), minus the HUD
+        is_warning = False
+        target = detect(frame)
+        if target is not None:
+            (x, y), radius, center = target
+            pos_pts.appendleft(center)
+            rad_pts.appendleft(radius)
+            (dx, dy), growth_rate = Main.calculate_dynamics(pos_pts, rad_pts)
+            is_intercept, is_approaching = Main.assess_threat(x, y, dx, dy, growth_rate, center_x, center_y)
+            is_warning = is_intercept and is_approaching
+        t2 = time.perf_counter()
+
+        render_time += t1 - t0
+        track_time += t2 - t1
+
+        # Match the tracked blob to the nearest visible object
+        obj = None
+        if target is not None:
+            visible = [(o, truth) for o, truth in zip(scene, cam.last_truth) if truth["visible"]]
+            if visible:
+                obj = min(visible, key=lambda ot: (ot[1]["pixel"][0] - x) ** 2 + (ot[1]["pixel"][1] - y) ** 2)[0]
+        warnings.append(is_warning)
+        tracked.append(obj)
+
+        # Direction check once the tracker has enough history to report one
+        if obj is not None and len(pos_pts) >= 10:
+            velocity = true_pixel_velocity(obj, t, cam)
+            if velocity is not None:
+                direction_total += 1
+                if Main.get_direction_label(dx, dy) == Main.get_direction_label(int(velocity[0]), int(velocity[1])):
+                    direction_hits += 1
+
+    # --- SCORING ---
+    frames = len(warnings)
+    impacts = {obj: obj.impact_time() for obj in scene}
+    impacts = {obj: ti for obj, ti in impacts.items() if ti is not None and ti <= duration}
+
+    # Group warning frames into episodes of (start_s, end_s, object tracked at start)
+    episodes = []
+    for i, w in enumerate(warnings):
+        if w and (i == 0 or not warnings[i - 1]):
+            episodes.append([i / float(fps), i / float(fps), tracked[i]])
+        elif w:
+            episodes[-1][1] = i / float(fps)
+
+    # See WARNING_HORIZON for the lead time rule
+    lead_times = []
+    for obj, ti in impacts.items():
+        final = [start for start, end, o in episodes
+                 if o is obj and start <= ti and end >= ti - WARNING_HORIZON]
+        lead_times.append(ti - final[-1] if final else None)
+
+    false_alarms = sum(1 for start, end, o in episodes if o not in impacts or start > impacts[o])
+
+    return {
+        "scenario": scenario,
+        "objects": count,
+        "frames": frames,
+        "impacts": len(impacts),
+        "missed": sum(1 for lt in lead_times if lt is None),
+        "lead_time": min((lt for lt in lead_times if lt is not None), default=None),
+        "false_alarms": false_alarms,
+        "direction_acc": direction_hits / float(direction_total) if direction_total else None,
+        "tracker_fps": frames / track_time if track_time else 0.0,
+        "pipeline_fps": frames / (render_time + track_time) if frames else 0.0,
+    }
+
+
+def format_row(r):
+    lead = f"{r['lead_time']:.2f}s" if r["lead_time"] is not None else "-"
+    acc = f"{r['direction_acc'] * 100:.0f}%" if r["direction_acc"] is not None else "-"
+    return (f"{r['scenario']:<10} {r['objects']:>7} {r['frames']:>6} {r['impacts'] - r['missed']:>3}/{r['impacts']:<3} "
+            f"{lead:>8} {r['false_alarms']:>6} {acc:>6} {r['tracker_fps']:>10.1f} {r['pipeline_fps']:>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score the Main.py tracker on synthetic debris scenes.")
+    parser.add_argument("--scenario", choices=simulator.SCENARIOS + ("all",), default="all")
+    parser.add_argument("--objects", type=int, nargs="+", default=OBJECT_COUNTS)
+    parser.add_argument("--width", type=int, default=simulator.FRAME_WIDTH)
+    parser.add_argument("--height", type=int, default=simulator.FRAME_HEIGHT)
+    parser.add_argument("--fps", type=int, default=simulator.FRAME_RATE)
+    parser.add_argument("--duration", type=float, default=6.0)
+    parser.add_argument("--sprites", action="store_true",
+                        help="Use Find-PaperBalls crops instead of red balls, detected with the YOLO model")
+    parser.add_argument("--model", default=MODEL_PATH, help="YOLO weights used with --sprites")
+    parser.add_argument("--seed", type=int, default=0)
+
+    # Tracker tuning (overrides the constants in Main.py for this run)
+    parser.add_argument("--prediction-frames", type=int, default=Main.PREDICTION_FRAMES)
+    parser.add_argument("--collision-zone", type=int, default=Main.COLLISION_ZONE)
+    parser.add_argument("--growth-threshold", type=float, default=Main.GROWTH_THRESHOLD)
+    parser.add_argument("--movement-threshold", type=float, default=Main.MOVEMENT_THRESHOLD)
+
+    # Regression gates (exit code 1 if any fails)
+    parser.add_argument("--min-fps", type=float, help="Minimum sustained tracker FPS")
+    parser.add_argument("--min-lead", type=float, help="Minimum warning lead time in seconds")
+    parser.add_argument("--max-false-alarms", type=int, help="Maximum false alarms per run")
+    args = parser.parse_args()
+
+    Main.PREDICTION_FRAMES = args.prediction_frames
+    Main.COLLISION_ZONE = args.collision_zone
+    Main.GROWTH_THRESHOLD = args.growth_threshold
+    Main.MOVEMENT_THRESHOLD = args.movement_threshold
+
+    # The crops are not red, so Main.py's HSV mask cannot see them
+    sprites = simulator.load_sprites() if args.sprites else None
+    detect = yolo_detector(args.model) if args.sprites else Main.detect_target
+    scenarios = simulator.SCENARIOS if args.scenario == "all" else (args.scenario,)
+
+    sensor = "YOLO" if args.sprites else "HSV"
+    print(f"🛰️ AADES BENCHMARK: {args.width}x{args.height} @ {args.fps}fps, {args.duration:.1f}s per run, {sensor} sensor")
+    print(f"{'SCENARIO':<10} {'OBJECTS':>7} {'FRAMES':>6} {'HIT':>7} {'LEAD':>8} {'FALSE':>6} {'DIR':>6} "
+          f"{'TRACK FPS':>10} {'TOTAL FPS':>10}")
+
+    failures = []
+    for scenario in scenarios:
+        for count in args.objects:
+            r = run_trial(scenario, count, args.width, args.height, args.fps, args.duration, args.seed,
+                          sprites, detect)
+            print(format_row(r))
+
+            tag = f"{scenario}/{count}"
+            if args.min_fps is not None and r["tracker_fps"] < args.min_fps:
+                failures.append(f"{tag}: tracker FPS {r['tracker_fps']:.1f} < {args.min_fps}")
+            if args.min_lead is not None and r["impacts"]:
+                if r["missed"]:
+                    failures.append(f"{tag}: {r['missed']} impact(s) with no warning")
+                elif r["lead_time"] < args.min_lead:
+                    failures.append(f"{tag}: lead time {r['lead_time']:.2f}s < {args.min_lead}s")
+            if args.max_false_alarms is not None and r["false_alarms"] > args.max_false_alarms:
+                failures.append(f"{tag}: {r['false_alarms']} false alarms > {args.max_false_alarms}")
+
+    if failures:
+        print("\n❌ REGRESSION:")
+        for f in failures:
+            print(f"  {f}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
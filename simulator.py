@@ -0,0 +1,296 @@
+import glob
+import os
+import random
+import time
+
+import cv2
+import numpy as np
+
+# --- CONFIGURATION ---
+# Output Stream
+FRAME_WIDTH = 640
+FRAME_HEIGHT = 480
+FRAME_RATE = 30
+
+# Camera Model (metres, pinhole camera at the origin looking down +Z)
+FOCAL_SCALE = 1.0        # Focal length in pixels = FRAME_WIDTH * FOCAL_SCALE (~53 deg FOV)
+SATELLITE_RADIUS = 1.0   # Physical size of the "Satellite Body" around the optical axis
+IMPACT_DEPTH = 1.0       # Debris closer than this has reached the satellite
+DEBRIS_RADIUS = 0.25     # Physical radius of one paper ball
+
+# Rendering
+BALL_COLOR = (30, 30, 210)   # BGR, inside the LOWER_RED/UPPER_RED range used by Main.py
+BACKGROUND_NOISE = 8         # Sensor noise amplitude (0 disables)
+STAR_COUNT = 150
+
+DATASET_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           "Find-PaperBalls-1", "Find-PaperBalls-2")
+
+SCENARIOS = ("approach", "flyby", "receding", "occlusion")
+
+
+class Debris(object):
+    """One object on a straight-line 3-D trajectory.
+
+    position(t) = start + velocity * t, in metres. `gaps` is a list of
+    (start_s, end_s) windows during which the object is hidden.
+    """
+
+    def __init__(self, start, velocity, radius=DEBRIS_RADIUS, gaps=(), sprite=None, name="debris"):
+        self.start = np.array(start, dtype=float)
+        self.velocity = np.array(velocity, dtype=float)
+        self.radius = radius
+        self.gaps = list(gaps)
+        self.sprite = sprite
+        self.name = name
+
+    def position(self, t):
+        return self.start + self.velocity * t
+
+    def is_occluded(self, t):
+        return any(g0 <= t < g1 for g0, g1 in self.gaps)
+
+    def impact_time(self):
+        """First time the object reaches the satellite, or None if it never does."""
+        z0, vz = self.start[2], self.velocity[2]
+        if z0 <= IMPACT_DEPTH:
+            t = 0.0
+        elif vz >= 0:
+            return None
+        else:
+            t = (IMPACT_DEPTH - z0) / vz
+        x, y, _ = self.position(t)
+        if np.hypot(x, y) > SATELLITE_RADIUS:
+            return None
+        return t
+
+
+def project(point, radius, width, height):
+    """Pinhole projection. Returns ((u, v), pixel_radius), or None once z <= IMPACT_DEPTH.
+
+    The cutoff is intentional: debris that has reached the satellite is
+    gone, so ground_truth() marks it invisible and render() stops drawing it.
+    """
+    x, y, z = point
+    if z <= IMPACT_DEPTH:
+        return None
+    f = width * FOCAL_SCALE
+    u = width / 2.0 + f * x / z
+    v = height / 2.0 + f * y / z
+    return (u, v), f * radius / z
+
+
+def load_sprites(dataset_dir=DATASET_DIR, limit=None):
+    """Cuts labelled paper balls out of the Roboflow dataset (YOLO txt labels)."""
+    sprites = []
+    for image_path in sorted(glob.glob(os.path.join(dataset_dir, "*", "images", "*.jpg"))):
+        label_path = image_path.replace(os.sep + "images" + os.sep, os.sep + "labels" + os.sep)
+        label_path = os.path.splitext(label_path)[0] + ".txt"
+        if not os.path.exists(label_path):
+            continue
+        image = cv2.imread(image_path)
+        if image is None:
+            continue
+        h, w, _ = image.shape
+        with open(label_path) as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) != 5:
+                    continue
+                cx, cy, bw, bh = (float(p) for p in parts[1:])
+                x1, y1 = int((cx - bw / 2) * w), int((cy - bh / 2) * h)
+                x2, y2 = int((cx + bw / 2) * w), int((cy + bh / 2) * h)
+                crop = image[max(y1, 0):y2, max(x1, 0):x2]
+                if crop.size:
+                    sprites.append(crop)
+                if limit and len(sprites) >= limit:
+                    return sprites
+    return sprites
+
+
+def build_scene(scenario="approach", count=1, seed=0, sprites=None):
+    """Returns a list of Debris: one scripted primary object plus `count - 1` distractors.
+
+    Distractors fly across the field at constant depth, so they cross the
+    collision zone on screen but never actually hit the satellite.
+    """
+    if scenario not in SCENARIOS:
+        raise ValueError(f"Unknown scenario '{scenario}', expected one of {SCENARIOS}")
+    rng = random.Random(seed)
+
+    def pick_sprite():
+        return rng.choice(sprites) if sprites else None
+
+    if scenario == "approach":
+        primary = Debris((0.4, -0.3, 15.0), (-0.08, 0.06, -3.0))
+    elif scenario == "flyby":
+        primary = Debris((-4.0, 0.2, 6.0), (1.6, 0.0, -0.3))
+    elif scenario == "receding":
+        primary = Debris((0.1, 0.1, 2.0), (0.0, 0.0, 2.5))
+    else:
+        primary = Debris((-0.6, 0.4, 15.0), (0.12, -0.08, -3.0), gaps=[(1.5, 2.0), (3.0, 3.3)])
+    primary.sprite = pick_sprite()
+    primary.name = scenario
+
+    scene = [primary]
+    for i in range(1, count):
+        depth = rng.uniform(6.0, 14.0)
+        half_width = depth / (2.0 * FOCAL_SCALE)  # Half the visible field at this depth
+        direction = rng.choice((-1, 1))
+        start = (-direction * half_width * rng.uniform(0.8, 1.5),
+                 rng.uniform(-0.6, 0.6) * half_width,
+                 depth)
+        velocity = (direction * rng.uniform(0.5, 2.5), rng.uniform(-0.3, 0.3), 0.0)
+        scene.append(Debris(start, velocity, radius=DEBRIS_RADIUS * rng.uniform(0.5, 1.0),
+                            sprite=pick_sprite(), name=f"distractor_{i}"))
+    return scene
+
+
+def render_background(width, height, seed=0):
+    rng = np.random.default_rng(seed)
+    frame = np.zeros((height, width, 3), dtype=np.uint8)
+    xs = rng.integers(0, width, STAR_COUNT)
+    ys = rng.integers(0, height, STAR_COUNT)
+    frame[ys, xs] = rng.integers(80, 200, (STAR_COUNT, 1))
+    return frame
+
+
+def draw_debris(frame, center, pixel_radius, sprite=None):
+    u, v = int(round(center[0])), int(round(center[1]))
+    r = int(round(pixel_radius))
+    if r < 1:
+        return
+    if sprite is None:
+        cv2.circle(frame, (u, v), r, BALL_COLOR, -1, cv2.LINE_AA)
+        return
+
+    h, w, _ = frame.shape
+    x1, y1, x2, y2 = u - r, v - r, u + r, v + r
+    if x2 <= 0 or y2 <= 0 or x1 >= w or y1 >= h:
+        return
+    patch = cv2.resize(sprite, (2 * r, 2 * r))
+    mask = np.zeros((2 * r, 2 * r), dtype=np.uint8)
+    cv2.circle(mask, (r, r), r, 255, -1)
+    # Clip the patch to the frame
+    px1, py1 = max(0, -x1), max(0, -y1)
+    px2, py2 = 2 * r - max(0, x2 - w), 2 * r - max(0, y2 - h)
+    roi = frame[max(y1, 0):min(y2, h), max(x1, 0):min(x2, w)]
+    m = mask[py1:py2, px1:px2] > 0
+    roi[m] = patch[py1:py2, px1:px2][m]
+
+
+class SyntheticCamera(object):
+    """Drop-in replacement for cv2.VideoCapture that renders a scripted scene.
+
+    read() returns (ret, frame) like a webcam; `last_truth` holds the
+    ground truth for the most recent frame.
+    """
+
+    def __init__(self, scene, width=FRAME_WIDTH, height=FRAME_HEIGHT, fps=FRAME_RATE,
+                 duration=6.0, realtime=False, seed=0):
+        self.scene = scene
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.total_frames = int(duration * fps)
+        self.realtime = realtime
+        self.frame_index = 0
+        self.last_truth = None
+        self.background = render_background(width, height, seed)
+        self.rng = np.random.default_rng(seed)
+        self._last_read = None
+
+    def isOpened(self):
+        return self.frame_index < self.total_frames
+
+    def get(self, prop):
+        if prop == cv2.CAP_PROP_FRAME_WIDTH: return self.width
+        if prop == cv2.CAP_PROP_FRAME_HEIGHT: return self.height
+        if prop == cv2.CAP_PROP_FPS: return self.fps
+        if prop == cv2.CAP_PROP_FRAME_COUNT: return self.total_frames
+        if prop == cv2.CAP_PROP_POS_FRAMES: return self.frame_index
+        return 0
+
+    def set(self, prop, value):
+        return False
+
+    def release(self):
+        self.frame_index = self.total_frames
+
+    def ground_truth(self, t):
+        """Per-object state at time t (projected position, radius, visibility)."""
+        truth = []
+        for obj in self.scene:
+            pos = obj.position(t)
+            proj = project(pos, obj.radius, self.width, self.height)
+            impact = obj.impact_time()
+            truth.append({
+                "name": obj.name,
+                "position": tuple(float(c) for c in pos),
+                "pixel": (float(proj[0][0]), float(proj[0][1])) if proj else None,
+                "pixel_radius": float(proj[1]) if proj else 0.0,
+                "visible": proj is not None and not obj.is_occluded(t),
+                "impact_time": float(impact) if impact is not None else None,
+            })
+        return truth
+
+    def render(self, t):
+        frame = self.background.copy()
+        # Painter's algorithm: far objects first
+        for obj in sorted(self.scene, key=lambda o: -o.position(t)[2]):
+            if obj.is_occluded(t):
+                continue
+            proj = project(obj.position(t), obj.radius, self.width, self.height)
+            if proj is not None:
+                draw_debris(frame, proj[0], proj[1], obj.sprite)
+        if BACKGROUND_NOISE:
+            noise = self.rng.integers(0, BACKGROUND_NOISE, frame.shape, dtype=np.uint8)
+            frame = cv2.add(frame, noise)
+        return frame
+
+    def read(self):
+        if self.frame_index >= self.total_frames:
+            return False, None
+        if self.realtime:
+            # Pace output to the configured frame rate, like a real camera
+            now = time.perf_counter()
+            if self._last_read is not None:
+                wait = 1.0 / self.fps - (now - self._last_read)
+                if wait > 0:
+                    time.sleep(wait)
+            self._last_read = time.perf_counter()
+
+        t = self.frame_index / float(self.fps)
+        frame = self.render(t)
+        self.last_truth = self.ground_truth(t)
+        self.frame_index += 1
+        return True, frame
+
+
+if __name__ == "__main__":
+    import argparse
+    import Main
+
+    parser = argparse.ArgumentParser(description="Play a synthetic debris scene through Main.py's HUD "
+                                                 "(or Main2.py's with --sprites).")
+    parser.add_argument("--scenario", choices=SCENARIOS, default="approach")
+    parser.add_argument("--objects", type=int, default=1)
+    parser.add_argument("--width", type=int, default=FRAME_WIDTH)
+    parser.add_argument("--height", type=int, default=FRAME_HEIGHT)
+    parser.add_argument("--fps", type=int, default=FRAME_RATE)
+    parser.add_argument("--duration", type=float, default=6.0)
+    parser.add_argument("--sprites", action="store_true",
+                        help="Use Find-PaperBalls crops instead of red balls and play them through Main2.py (YOLO)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    sprites = load_sprites() if args.sprites else None
+    scene = build_scene(args.scenario, args.objects, args.seed, sprites)
+    cam = SyntheticCamera(scene, args.width, args.height, args.fps, args.duration,
+                          realtime=True, seed=args.seed)
+    if args.sprites:
+        # The crops are not red, so only the YOLO pipeline can see them
+        import Main2
+        Main2.main(cam)
+    else:
+        Main.main(cam)